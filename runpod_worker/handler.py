@@ -1,11 +1,17 @@
 """RunPod serverless entrypoint for the Seed-VC worker."""
 from __future__ import annotations
 
-import base64
+import hashlib
 import os
+import shutil
 import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, List, Optional, Sequence, cast
+from urllib.parse import parse_qsl, urlencode, urlparse
 
 try:  # pragma: no cover - runpod only exists inside the worker image.
     import runpod  # type: ignore[import]
@@ -17,13 +23,20 @@ try:  # pragma: no cover - requests is only required inside the worker image.
 except ModuleNotFoundError:  # pragma: no cover - optional dependency locally.
     requests = None  # type: ignore[assignment]
 
+from singing_voice.codec import b64decode
 from singing_voice.manifests import PreprocessManifest
 from runpod_worker.seedvc_worker import convert_manifest
 
 TARGET_VOICE_ENV = "TARGET_VOICE_PATH"
 MODEL_PATH_ENV = "SEEDVC_MODEL_PATH"
+ASSET_CACHE_ENV = "SEEDVC_ASSET_CACHE_DIR"
+ASSET_CACHE_MAX_BYTES_ENV = "SEEDVC_ASSET_CACHE_MAX_BYTES"
 DEFAULT_TARGET_NAME = "target_voice.wav"
 DEFAULT_MODEL_NAME = "seedvc_model.pt"
+DEFAULT_BINARY_NAME = "audio.pcm"
+DOWNLOAD_BUFFER_SIZE = 8 * 1024 * 1024
+DEFAULT_ASSET_CACHE_DIR = Path(tempfile.gettempdir()) / "seedvc-assets"
+DEFAULT_ASSET_CACHE_MAX_BYTES = 10 * 1024**3
 
 
 def _extract_inputs(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -49,17 +62,173 @@ def _extract_manifest(inputs: Dict[str, Any]) -> PreprocessManifest:
     return PreprocessManifest.from_dict(manifest_payload)
 
 
-def _download_file(url: str, destination: Path) -> None:
+def _open_download(url: str) -> "requests.Response":
     if requests is None:  # pragma: no cover - guarded for local linting.
         raise RuntimeError("requests is required inside the worker image to download files.")
 
     response = requests.get(url, stream=True, timeout=300)
-    response.raise_for_status()
+    try:
+        response.raise_for_status()
+    except Exception:
+        response.close()
+        raise
+    return response
+
 
+def _write_response(response: "requests.Response", destination: Path) -> None:
+    # Read straight from the socket (still honouring gzip/deflate) in large
+    # blocks instead of materialising a bytes object per iter_content chunk.
+    response.raw.decode_content = True
     with destination.open("wb") as handle:
-        for chunk in response.iter_content(chunk_size=1024 * 1024):
-            if chunk:
-                handle.write(chunk)
+        shutil.copyfileobj(response.raw, handle, length=DOWNLOAD_BUFFER_SIZE)
+
+
+def _download_file(url: str, destination: Path) -> None:
+    with _open_download(url) as response:
+        _write_response(response, destination)
+
+
+def _short_hash(value: str, length: int) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:length]
+
+
+# Query parameters that pre-signed S3/GCS/Azure URLs rotate on every request;
+# everything else in the query (e.g. ``?id=voice``) identifies the asset.
+_SIGNING_PARAM_PREFIXES = ("x-amz-", "x-goog-")
+_SIGNING_PARAMS = frozenset(
+    {
+        # S3 (SigV2) / GCS
+        "signature", "expires", "awsaccesskeyid", "googleaccessid",
+        # Azure SAS
+        "sig", "se", "st", "sv", "sp", "sr", "spr", "skoid", "sktid", "skt", "ske", "sks", "skv",
+        "token",
+    }
+)
+
+# Serialises cache publishing/pruning; ``_PINNED`` counts the requests holding each path.
+_CACHE_LOCK = threading.Lock()
+_PINNED: Counter[Path] = Counter()
+
+
+def _asset_key(url: str, default_name: str) -> str:
+    parsed = urlparse(url)
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if name.lower() not in _SIGNING_PARAMS
+        and not name.lower().startswith(_SIGNING_PARAM_PREFIXES)
+    )
+    stable_url = parsed._replace(query=urlencode(query), fragment="").geturl()
+    return _short_hash(f"{default_name}\n{stable_url}", 16)
+
+
+class _Pins:
+    """Cache paths one request has been handed; pruning skips them until released."""
+
+    def __init__(self) -> None:
+        self.paths: List[Path] = []
+        self.released = False
+
+    def add(self, path: Path) -> None:
+        # Callers hold ``_CACHE_LOCK``. A resolve that outlives a failed request
+        # has nobody to hand its path to, so it does not pin it.
+        if not self.released:
+            _PINNED[path] += 1
+            self.paths.append(path)
+
+    def release(self) -> None:
+        with _CACHE_LOCK:
+            for path in self.paths:
+                _PINNED[path] -= 1
+                if _PINNED[path] <= 0:
+                    del _PINNED[path]
+            self.paths.clear()
+            self.released = True
+
+
+def _cached_download(url: str, default_name: str, tmp_dir: Path, pinned: _Pins) -> Path:
+    """Download ``url`` through the per-container asset cache.
+
+    Entries are keyed by ``default_name`` plus the URL minus its signing query
+    parameters (pre-signed URLs rotate them), and versioned by the response's
+    ETag/Last-Modified/Content-Length so changed content is fetched again.
+    Responses without any validator skip the cache and land in ``tmp_dir``.
+    Returned cache paths are added to ``pinned`` and survive pruning until it is
+    released.
+    """
+
+    cache_dir = Path(os.getenv(ASSET_CACHE_ENV) or DEFAULT_ASSET_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    with _open_download(url) as response:
+        headers = response.headers
+        validator = "|".join(
+            headers.get(name, "") for name in ("ETag", "Last-Modified", "Content-Length")
+        )
+        if not validator.strip("|"):
+            destination = tmp_dir / default_name
+            _write_response(response, destination)
+            return destination
+
+        prefix = f"{_asset_key(url, default_name)}_"
+        destination = cache_dir / f"{prefix}{_short_hash(validator, 8)}_{default_name}"
+        with _CACHE_LOCK:
+            if destination.exists():
+                # Hits close the response unread. Recency lives in atime only:
+                # the worker keys its target-voice cache on the mtime.
+                mtime_ns = destination.stat().st_mtime_ns
+                os.utime(destination, ns=(time.time_ns(), mtime_ns))
+                pinned.add(destination)
+                return destination
+
+        # Publish atomically so a failed or concurrent download never leaves a
+        # truncated file behind under the cached name.
+        partial = destination.with_name(
+            f"{destination.name}.{os.getpid()}.{threading.get_ident()}.part"
+        )
+        try:
+            _write_response(response, partial)
+            with _CACHE_LOCK:
+                os.replace(partial, destination)
+                pinned.add(destination)
+                _prune_cache(cache_dir, superseded_prefix=prefix)
+        finally:
+            partial.unlink(missing_ok=True)
+
+    return destination
+
+
+def _prune_cache(cache_dir: Path, superseded_prefix: str) -> None:
+    """Drop older versions of a just-published asset and evict LRU entries.
+
+    Callers hold ``_CACHE_LOCK``. The cap comes from
+    ``$SEEDVC_ASSET_CACHE_MAX_BYTES``; pinned entries always survive.
+    """
+
+    max_bytes = int(os.getenv(ASSET_CACHE_MAX_BYTES_ENV) or DEFAULT_ASSET_CACHE_MAX_BYTES)
+    entries = []
+    total = 0
+    for entry in cache_dir.iterdir():
+        if entry.suffix == ".part":
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:  # Removed by another worker process.
+            continue
+        total += stat.st_size
+        if entry in _PINNED:
+            continue
+        if entry.name.startswith(superseded_prefix):
+            entry.unlink(missing_ok=True)
+            total -= stat.st_size
+            continue
+        entries.append((stat.st_atime, stat.st_size, entry))
+
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
 
 
 def _resolve_asset(
@@ -70,6 +239,7 @@ def _resolve_asset(
     default_name: str,
     inputs: Dict[str, Any],
     tmp_dir: Path,
+    pinned: _Pins,
 ) -> Path:
     env_value = os.getenv(env_var)
     if env_value:
@@ -82,20 +252,41 @@ def _resolve_asset(
     b64_value = inputs.get(b64_key)
     if isinstance(b64_value, str):
         destination = tmp_dir / default_name
-        destination.write_bytes(base64.b64decode(b64_value))
+        destination.write_bytes(b64decode(b64_value))
         return destination
 
     url_value = inputs.get(url_key)
     if isinstance(url_value, str):
-        destination = tmp_dir / default_name
-        _download_file(url_value, destination)
-        return destination
+        return _cached_download(url_value, default_name, tmp_dir, pinned)
 
     raise ValueError(
         f"Provide '{b64_key}' or '{url_key}', or set the {env_var} environment variable."
     )
 
 
+def _resolve_binary(binary_url: Optional[str], tmp_dir: Path) -> Optional[Path]:
+    if not binary_url:
+        return None
+
+    # Only fetch over HTTP(S); local paths would let a request read worker files.
+    if urlparse(binary_url).scheme not in ("http", "https"):
+        raise ValueError(f"'binary_url' must be an http(s) URL, got {binary_url!r}.")
+    destination = tmp_dir / DEFAULT_BINARY_NAME
+    _download_file(binary_url, destination)
+    return destination
+
+
+def _gather(futures: Sequence[Future]) -> List[Any]:
+    """Return the futures' results in order, raising the first failure immediately."""
+
+    done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+    for future in done:
+        error = future.exception()
+        if error is not None:
+            raise error
+    return [future.result() for future in futures]
+
+
 def handler(event: Dict[str, Any]) -> Dict[str, Any]:
     inputs = _extract_inputs(event)
 
@@ -104,30 +295,50 @@ def handler(event: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as exc:
         return {"status": "error", "error": str(exc)}
 
-    with tempfile.TemporaryDirectory() as tmp:
+    # A failed resolve returns without waiting for the other downloads, which may
+    # still be writing into the directory while it is removed.
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
         tmp_dir = Path(tmp)
+        pinned = _Pins()
         try:
-            target_voice_path = _resolve_asset(
-                env_var=TARGET_VOICE_ENV,
-                b64_key="target_voice_b64",
-                url_key="target_voice_url",
-                default_name=DEFAULT_TARGET_NAME,
-                inputs=inputs,
-                tmp_dir=tmp_dir,
-            )
-            model_path = _resolve_asset(
-                env_var=MODEL_PATH_ENV,
-                b64_key="model_b64",
-                url_key="model_url",
-                default_name=DEFAULT_MODEL_NAME,
-                inputs=inputs,
-                tmp_dir=tmp_dir,
-            )
+            # The assets are independent downloads; fetch them concurrently.
+            pool = ThreadPoolExecutor(max_workers=3)
+            try:
+                target_future = pool.submit(
+                    _resolve_asset,
+                    env_var=TARGET_VOICE_ENV,
+                    b64_key="target_voice_b64",
+                    url_key="target_voice_url",
+                    default_name=DEFAULT_TARGET_NAME,
+                    inputs=inputs,
+                    tmp_dir=tmp_dir,
+                    pinned=pinned,
+                )
+                model_future = pool.submit(
+                    _resolve_asset,
+                    env_var=MODEL_PATH_ENV,
+                    b64_key="model_b64",
+                    url_key="model_url",
+                    default_name=DEFAULT_MODEL_NAME,
+                    inputs=inputs,
+                    tmp_dir=tmp_dir,
+                    pinned=pinned,
+                )
+                binary_future = pool.submit(_resolve_binary, manifest.binary_url, tmp_dir)
+                target_voice_path, model_path, binary_path = _gather(
+                    [target_future, model_future, binary_future]
+                )
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
 
-            converted = convert_manifest(manifest, target_voice_path, model_path)
+            converted = convert_manifest(
+                manifest, target_voice_path, model_path, binary_path=binary_path
+            )
             return {"status": "success", "converted_manifest": converted.to_dict()}
         except Exception as exc:
             return {"status": "error", "error": str(exc)}
+        finally:
+            pinned.release()
 
 
 if runpod:
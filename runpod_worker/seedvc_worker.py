@@ -1,68 +1,118 @@
 """Reference implementation for the Seed-VC RunPod worker (Step B)."""
 from __future__ import annotations
 
-import base64
-import io
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Iterable
+from typing import List, Optional, Sequence
 
 import librosa
 import numpy as np
-import soundfile as sf
 
 try:
     from seed_vc.inference import inference_pipeline
 except ImportError:  # pragma: no cover - the actual worker image installs this.
     inference_pipeline = None  # type: ignore[assignment]
 
-from singing_voice.manifests import ChunkPayload, ConvertedManifest, PreprocessManifest
+from singing_voice.codec import decode_chunk_audio, encode_pcm16, open_sidecar
+from singing_voice.manifests import (
+    PCM_S16LE,
+    ChunkPayload,
+    ConvertedManifest,
+    PreprocessManifest,
+)
 
 DEFAULT_SAMPLE_RATE = 16_000
+# Upper bound on decoded source samples held per batch (~60 s at 16 kHz).
+DEFAULT_MAX_BATCH_SAMPLES = 960_000
 
 
 def convert_manifest(
     manifest: PreprocessManifest,
     target_voice_path: Path,
     model_path: Path,
+    max_batch_samples: int = DEFAULT_MAX_BATCH_SAMPLES,
+    binary_path: Optional[Path] = None,
 ) -> ConvertedManifest:
     if inference_pipeline is None:  # pragma: no cover - guard for local linting
         raise RuntimeError("seed_vc is not available. Install it inside the RunPod image.")
 
-    target_voice, _ = librosa.load(target_voice_path, sr=manifest.sample_rate)
+    target_voice = _load_target(
+        str(target_voice_path), target_voice_path.stat().st_mtime, manifest.sample_rate
+    )
+    batches = _batch_chunks(manifest.chunks, max_batch_samples)
+    sidecar = open_sidecar(binary_path) if binary_path is not None else None
+    decode = partial(_decode_batch, sidecar=sidecar, sample_rate=manifest.sample_rate)
 
     converted = []
-    for chunk in manifest.chunks:
-        source_audio = _decode_chunk(chunk, manifest.sample_rate)
-        converted_audio = inference_pipeline(
-            source_audio,
-            target_voice,
-            model_path=str(model_path),
-        )
-        converted.append(
-            ChunkPayload(
-                chunk_id=chunk.chunk_id,
-                start=chunk.start,
-                end=chunk.end,
-                duration=len(converted_audio) / manifest.sample_rate,
-                audio_b64=_encode_wav(converted_audio, manifest.sample_rate),
-            )
-        )
+    # Decode the next batch on a helper thread while the GPU works on the current one.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(decode, batches[0]) if batches else None
+        for index, batch in enumerate(batches):
+            sources = pending.result()
+            if index + 1 < len(batches):
+                pending = pool.submit(decode, batches[index + 1])
+
+            outputs = _infer_batch(sources, target_voice, model_path)
+            for chunk, converted_audio in zip(batch, outputs):
+                converted.append(
+                    ChunkPayload(
+                        chunk_id=chunk.chunk_id,
+                        start=chunk.start,
+                        end=chunk.end,
+                        duration=len(converted_audio) / manifest.sample_rate,
+                        audio_b64=encode_pcm16(converted_audio),
+                        encoding=PCM_S16LE,
+                    )
+                )
 
     return ConvertedManifest(sample_rate=manifest.sample_rate, converted_chunks=converted)
 
 
-def _decode_chunk(chunk: ChunkPayload, sample_rate: int) -> np.ndarray:
-    audio_bytes = base64.b64decode(chunk.audio_b64)
-    data, sr = sf.read(io.BytesIO(audio_bytes), dtype="float32")
-    if sr != sample_rate:
-        data = librosa.resample(data, orig_sr=sr, target_sr=sample_rate)
-    return np.asarray(data, dtype=np.float32)
-
-
-def _encode_wav(audio: np.ndarray, sample_rate: int) -> str:
-    buffer = io.BytesIO()
-    sf.write(buffer, audio, samplerate=sample_rate, format="WAV")
-    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+@lru_cache(maxsize=4)
+def _load_target(path: str, mtime: float, sample_rate: int) -> np.ndarray:
+    # Warm containers usually reuse the same target voice; ``mtime`` invalidates
+    # the entry when the file is replaced. The array is shared, so freeze it.
+    target_voice, _ = librosa.load(path, sr=sample_rate)
+    target_voice.setflags(write=False)
+    return target_voice
+
+
+def _batch_chunks(
+    chunks: Sequence[ChunkPayload], max_batch_samples: int
+) -> List[List[ChunkPayload]]:
+    """Greedily group chunks so each batch stays under ``max_batch_samples``."""
+
+    batches: List[List[ChunkPayload]] = []
+    current: List[ChunkPayload] = []
+    current_samples = 0
+    for chunk in chunks:
+        samples = max(chunk.end - chunk.start, 0)
+        if current and current_samples + samples > max_batch_samples:
+            batches.append(current)
+            current, current_samples = [], 0
+        current.append(chunk)
+        current_samples += samples
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _decode_batch(
+    batch: Sequence[ChunkPayload], sidecar: Optional[np.ndarray], sample_rate: int
+) -> List[np.ndarray]:
+    return [decode_chunk_audio(chunk, sidecar, sample_rate) for chunk in batch]
+
+
+def _infer_batch(
+    sources: Sequence[np.ndarray], target_voice: np.ndarray, model_path: Path
+) -> List[np.ndarray]:
+    # seed_vc.inference only exposes a single-sample entrypoint; a batched
+    # pipeline (padded sources + length mask) can slot in here.
+    return [
+        inference_pipeline(source, target_voice, model_path=str(model_path))
+        for source in sources
+    ]
 
 
 __all__ = ["convert_manifest"]
@@ -28,6 +28,14 @@ def preprocess(
     silence_threshold_db: float = typer.Option(-40.0, help="dB threshold for detecting audio."),
     min_chunk_seconds: float = typer.Option(0.15, help="Minimum trimmed chunk length."),
     sample_rate: int = typer.Option(16_000, help="Sample rate for librosa.load and output files."),
+    workers: Optional[int] = typer.Option(
+        None, help="Threads used to encode chunks. Defaults to the CPU count."
+    ),
+    binary_sidecar: bool = typer.Option(
+        False,
+        "--binary-sidecar",
+        help="Write chunk PCM to <manifest>.pcm and reference it by byte range instead of base64.",
+    ),
 ):
     """Chunk + serialize audio so the RunPod worker can run inference."""
 
@@ -38,6 +46,8 @@ def preprocess(
         overlap_seconds=overlap_seconds,
         silence_threshold_db=silence_threshold_db,
         min_chunk_seconds=min_chunk_seconds,
+        max_workers=workers,
+        binary_sidecar=binary_sidecar,
     )
 
     manifest_target = manifest_path
@@ -83,6 +93,10 @@ def submit_runpod(
         "--output",
         help="Where to write the converted manifest returned by the worker.",
     ),
+    binary_url: Optional[str] = typer.Option(
+        None,
+        help="URL the worker can fetch the manifest's binary sidecar from (e.g. a pre-signed S3 URL).",
+    ),
 ):
     """Send chunks to the Seed-VC worker and store the returned manifest."""
 
@@ -96,6 +110,7 @@ def submit_runpod(
         api_key=api_key,
         timeout=timeout,
         output_path=output_path,
+        binary_url=binary_url,
     )
 
     typer.echo(
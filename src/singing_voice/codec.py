@@ -0,0 +1,124 @@
+"""Wire encoding helpers shared by the pipeline steps and the RunPod worker."""
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import soundfile as sf
+import soxr
+
+from .manifests import LEGACY_WAV, PCM_S16LE, ChunkPayload
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+try:  # pragma: no cover - pybase64 provides SIMD-accelerated codecs.
+    from pybase64 import b64decode as _b64decode
+    from pybase64 import b64encode_as_string as _b64encode_as_string
+except ImportError:  # pragma: no cover - stdlib fallback keeps local linting light.
+    from base64 import b64decode as _b64decode
+    from base64 import b64encode as _b64encode
+
+    def _b64encode_as_string(data: BytesLike) -> str:
+        return _b64encode(data).decode("ascii")
+
+
+def b64encode_as_string(data: BytesLike) -> str:
+    """Encode ``data`` (any buffer, e.g. ``BytesIO.getbuffer()``) to an ASCII ``str``."""
+
+    return _b64encode_as_string(data)
+
+
+def b64decode(data: Union[str, bytes]) -> bytes:
+    """Strictly decode ``data``; invalid characters raise ``binascii.Error``."""
+
+    return _b64decode(data, validate=True)
+
+
+def to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Clip ``audio`` to [-1, 1] and quantize it to little-endian int16."""
+
+    scaled = np.clip(audio, -1.0, 1.0)
+    scaled *= 32767
+    return scaled.astype("<i2")
+
+
+def encode_pcm16(audio: np.ndarray) -> str:
+    """Serialize ``audio`` as base64 ``pcm_s16le``."""
+
+    # Hand the int16 buffer straight to the encoder; ``tobytes()`` would copy it.
+    return b64encode_as_string(to_pcm16(audio).data)
+
+
+def open_sidecar(path: Path) -> np.ndarray:
+    """Memory-map a binary sidecar written by the preprocessor as int16 samples."""
+
+    if path.stat().st_size == 0:
+        return np.zeros(0, dtype="<i2")
+    return np.memmap(path, dtype="<i2", mode="r")
+
+
+def decode_chunk_pcm16(chunk: ChunkPayload, sidecar: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return the raw int16 samples of ``chunk`` (possibly a read-only view).
+
+    Chunks that carry ``byte_offset``/``byte_length`` are sliced out of ``sidecar``
+    (see :func:`open_sidecar`) instead of being base64-decoded.
+    """
+
+    if chunk.encoding != PCM_S16LE:
+        raise ValueError(
+            f"Unsupported chunk encoding {chunk.encoding!r}; expected {PCM_S16LE!r}."
+        )
+
+    if chunk.byte_offset is not None:
+        if sidecar is None:
+            raise ValueError(
+                f"Chunk {chunk.chunk_id} references a binary sidecar but none was provided."
+            )
+        offset, length = chunk.byte_offset, chunk.byte_length or 0
+        # A bad range must not silently yield short or wrapped-around audio.
+        aligned = offset % 2 == 0 and length % 2 == 0
+        if offset < 0 or length < 0 or not aligned or offset + length > sidecar.nbytes:
+            raise ValueError(
+                f"Chunk {chunk.chunk_id} has sidecar range [{offset}, {offset + length}) that is "
+                f"not an int16-aligned slice of the {sidecar.nbytes}-byte sidecar."
+            )
+        return sidecar[offset // 2 : (offset + length) // 2]
+    return np.frombuffer(b64decode(chunk.audio_b64), dtype="<i2")
+
+
+def decode_chunk_audio(
+    chunk: ChunkPayload,
+    sidecar: Optional[np.ndarray] = None,
+    sample_rate: Optional[int] = None,
+) -> np.ndarray:
+    """Return the float32 samples of ``chunk`` at its manifest's sample rate.
+
+    Legacy WAV chunks carry their own rate and are resampled to ``sample_rate``
+    when it is given and differs.
+    """
+
+    if chunk.encoding == LEGACY_WAV:
+        return _decode_legacy_wav(chunk, sample_rate)
+    samples = decode_chunk_pcm16(chunk, sidecar).astype(np.float32)
+    samples /= 32768.0
+    return samples
+
+
+def _decode_legacy_wav(chunk: ChunkPayload, sample_rate: Optional[int]) -> np.ndarray:
+    data, sr = sf.read(io.BytesIO(b64decode(chunk.audio_b64)), dtype="float32")
+    if sample_rate is not None and sr != sample_rate:
+        data = soxr.resample(data, sr, sample_rate, quality="HQ")
+    return np.asarray(data, dtype=np.float32)
+
+
+__all__ = [
+    "b64encode_as_string",
+    "b64decode",
+    "to_pcm16",
+    "encode_pcm16",
+    "open_sidecar",
+    "decode_chunk_pcm16",
+    "decode_chunk_audio",
+]
@@ -1,10 +1,23 @@
 """Typed helpers for the JSON exchanged between the pipeline steps."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import msgspec
+import numpy as np
+import orjson
+
+# Parallel ``(starts, ends, chunk_ids, payloads)`` view over a chunk list.
+ChunkArrays = Tuple[np.ndarray, np.ndarray, List[str], List["ChunkPayload"]]
+
+# Chunk audio travels as little-endian int16 PCM at the manifest sample rate, either
+# inline as base64 or as a byte range of the manifest's binary sidecar.
+PCM_S16LE = "pcm_s16le"
+# Payloads written before ``encoding`` existed carry base64 WAV files instead.
+LEGACY_WAV = "wav"
 
 
 @dataclass
@@ -12,31 +25,46 @@ class ChunkPayload:
     chunk_id: str
     start: int
     end: int
-    duration: float
-    audio_b64: str
+    duration: float = 0.0
+    audio_b64: Optional[str] = None
+    # A missing ``encoding`` means a legacy payload; encoders always set PCM_S16LE.
+    encoding: str = LEGACY_WAV
+    byte_offset: Optional[int] = None
+    byte_length: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # msgspec runs this on decode too, so a chunk without audio fails to load.
+        if self.audio_b64 is None and (self.byte_offset is None or self.byte_length is None):
+            raise ValueError(
+                f"Chunk {self.chunk_id!r} needs 'audio_b64' or 'byte_offset'/'byte_length'."
+            )
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "chunk_id": self.chunk_id,
+            "start": self.start,
+            "end": self.end,
+            "duration": self.duration,
+            "audio_b64": self.audio_b64,
+            "encoding": self.encoding,
+            "byte_offset": self.byte_offset,
+            "byte_length": self.byte_length,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChunkPayload":
-        return cls(
-            chunk_id=data["chunk_id"],
-            start=int(data["start"]),
-            end=int(data["end"]),
-            duration=float(data.get("duration", 0.0)),
-            audio_b64=data["audio_b64"],
-        )
+        return msgspec.convert(data, type=cls, strict=False)
 
 
 @dataclass
 class PreprocessManifest:
     sample_rate: int
-    source: str
-    chunk_seconds: float
-    overlap_seconds: float
-    created_at: str
+    source: str = ""
+    chunk_seconds: float = 0.0
+    overlap_seconds: float = 0.0
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     chunks: List[ChunkPayload] = field(default_factory=list)
+    binary_url: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -46,18 +74,15 @@ class PreprocessManifest:
             "overlap_seconds": self.overlap_seconds,
             "created_at": self.created_at,
             "chunks": [chunk.to_dict() for chunk in self.chunks],
+            "binary_url": self.binary_url,
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PreprocessManifest":
-        return cls(
-            sample_rate=int(data["sample_rate"]),
-            source=str(data.get("source", "")),
-            chunk_seconds=float(data.get("chunk_seconds", 0.0)),
-            overlap_seconds=float(data.get("overlap_seconds", 0.0)),
-            created_at=str(data.get("created_at", datetime.utcnow().isoformat())),
-            chunks=[ChunkPayload.from_dict(item) for item in data.get("chunks", [])],
-        )
+        return msgspec.convert(data, type=cls, strict=False)
+
+    def as_soa(self) -> ChunkArrays:
+        return chunks_as_soa(self.chunks)
 
 
 @dataclass
@@ -73,62 +98,80 @@ class ConvertedManifest:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ConvertedManifest":
-        return cls(
-            sample_rate=int(data["sample_rate"]),
-            converted_chunks=[ChunkPayload.from_dict(item) for item in data.get("converted_chunks", [])],
-        )
+        return msgspec.convert(data, type=cls, strict=False)
+
+    def as_soa(self) -> ChunkArrays:
+        return chunks_as_soa(self.converted_chunks)
+
+
+def chunks_as_soa(chunks: Iterable[ChunkPayload]) -> ChunkArrays:
+    """Split ``chunks`` into int64 ``starts``/``ends`` arrays plus parallel lists.
+
+    Hot paths sort and scan the arrays (e.g. ``np.argsort(starts)``) instead of
+    touching each dataclass attribute.
+    """
+
+    payloads = list(chunks)
+    starts = np.fromiter((chunk.start for chunk in payloads), dtype=np.int64, count=len(payloads))
+    ends = np.fromiter((chunk.end for chunk in payloads), dtype=np.int64, count=len(payloads))
+    return starts, ends, [chunk.chunk_id for chunk in payloads], payloads
 
 
 def save_manifest(manifest: PreprocessManifest, path: Path) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(_json_dumps(manifest.to_dict()))
+    path.write_bytes(_json_dumps(manifest.to_dict()))
     return path
 
 
 def save_converted_manifest(manifest: ConvertedManifest, path: Path) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(_json_dumps(manifest.to_dict()))
+    path.write_bytes(_json_dumps(manifest.to_dict()))
     return path
 
 
-def _json_dumps(payload: Dict[str, Any]) -> str:
-    import json
+def _json_dumps(payload: Dict[str, Any]) -> bytes:
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
 
-    return json.dumps(payload, indent=2)
 
+# msgspec parses JSON straight into the dataclasses above, coercing types the way
+# the ``from_dict`` shims do; building the decoders once caches the type info.
+_PREPROCESS_DECODER = msgspec.json.Decoder(PreprocessManifest, strict=False)
+_CONVERTED_DECODER = msgspec.json.Decoder(ConvertedManifest, strict=False)
 
-def load_manifest(path: Path) -> PreprocessManifest:
-    import json
 
-    data = json.loads(path.read_text())
-    if "converted_chunks" in data and "chunks" not in data:
+def load_manifest(path: Path) -> PreprocessManifest:
+    raw = path.read_bytes()
+    manifest = _PREPROCESS_DECODER.decode(raw)
+    if not manifest.chunks and b'"converted_chunks"' in raw:
         # If a converted manifest is passed to the preprocessor loader we
         # still return a preprocess manifest so downstream tooling can inspect
         # original metadata.
+        converted = _CONVERTED_DECODER.decode(raw)
         return PreprocessManifest(
-            sample_rate=int(data["sample_rate"]),
+            sample_rate=converted.sample_rate,
             source=str(path),
-            chunk_seconds=float(data.get("chunk_seconds", 0.0)),
-            overlap_seconds=float(data.get("overlap_seconds", 0.0)),
-            created_at=str(data.get("created_at", "")),
-            chunks=[ChunkPayload.from_dict(item) for item in data.get("converted_chunks", [])],
+            chunk_seconds=manifest.chunk_seconds,
+            overlap_seconds=manifest.overlap_seconds,
+            created_at=manifest.created_at,
+            chunks=converted.converted_chunks,
         )
-    return PreprocessManifest.from_dict(data)
+    return manifest
 
 
 def load_converted_manifest(path: Path) -> ConvertedManifest:
-    import json
-
-    data = json.loads(path.read_text())
-    if "converted_chunks" not in data:
-        raise ValueError("Expected a converted manifest with 'converted_chunks'")
-    return ConvertedManifest.from_dict(data)
+    try:
+        return _CONVERTED_DECODER.decode(path.read_bytes())
+    except msgspec.ValidationError as exc:
+        raise ValueError(f"Invalid converted manifest {path}: {exc}") from exc
 
 
 __all__ = [
+    "PCM_S16LE",
+    "LEGACY_WAV",
     "ChunkPayload",
     "PreprocessManifest",
     "ConvertedManifest",
+    "chunks_as_soa",
     "save_manifest",
     "save_converted_manifest",
     "load_manifest",
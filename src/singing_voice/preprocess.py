@@ -1,19 +1,26 @@
 """Step A of the pipeline: trim, chunk, and serialize audio with librosa."""
 from __future__ import annotations
 
-import base64
-import io
+import os
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
 
 import librosa
 import numpy as np
 import soundfile as sf
 
-from .manifests import ChunkPayload, PreprocessManifest, save_manifest
+from .codec import encode_pcm16, to_pcm16
+from .manifests import PCM_S16LE, ChunkPayload, PreprocessManifest, save_manifest
+
+# Bytes of input audio framed per RMS block (see SilenceDetector._rms_blocks).
+_RMS_BLOCK_BYTES = 1 << 20
 
 
 @dataclass
@@ -25,6 +32,41 @@ class PreprocessorConfig:
     min_chunk_seconds: float = 0.15
     frame_length: int = 1024
     hop_length: int = 256
+    max_workers: Optional[int] = None
+    binary_sidecar: bool = False
+
+
+class StreamedAudio:
+    """Mono float32 view over a seekable :class:`soundfile.SoundFile`.
+
+    Implements the slicing/``shape`` subset of the ndarray API used by the
+    silence detector and chunker, so only the windows being processed are read
+    into memory instead of the whole file.
+    """
+
+    itemsize = np.dtype(np.float32).itemsize
+
+    def __init__(self, handle: sf.SoundFile) -> None:
+        self._handle = handle
+        # Encoder threads slice concurrently; seek + read must stay paired.
+        self._lock = threading.Lock()
+        self.size = int(handle.frames)
+        self.shape = (self.size,)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: slice) -> np.ndarray:
+        start, stop, _ = index.indices(self.size)
+        with self._lock:
+            self._handle.seek(start)
+            data = self._handle.read(max(stop - start, 0), dtype="float32", always_2d=True)
+        if data.shape[1] == 1:
+            return data[:, 0]
+        return data.mean(axis=1)
+
+
+AudioSource = Union[np.ndarray, StreamedAudio]
 
 
 class SilenceDetector:
@@ -35,28 +77,71 @@ class SilenceDetector:
         self.frame_length = frame_length
         self.hop_length = hop_length
 
-    def trim_bounds(self, audio: np.ndarray) -> Optional[Tuple[int, int]]:
+    def frame_db(self, audio: AudioSource) -> Optional[np.ndarray]:
+        """Per-frame RMS of ``audio`` in dB relative to its loudest frame."""
+
         if audio.size == 0:
             return None
 
-        rms = librosa.feature.rms(
-            y=audio,
-            frame_length=self.frame_length,
-            hop_length=self.hop_length,
-            center=True,
-        )[0]
+        rms = np.concatenate(list(self._rms_blocks(audio)))
         if not np.any(rms):
             return None
 
-        rms_db = librosa.amplitude_to_db(rms, ref=np.max)
-        mask = rms_db > self.threshold_db
-        if not np.any(mask):
+        return librosa.amplitude_to_db(rms, ref=np.max)
+
+    def _rms_blocks(self, audio: AudioSource) -> Iterator[np.ndarray]:
+        """Yield ``center=True`` RMS frames of ``audio`` one cache-sized block at a time.
+
+        Framing the whole signal at once materialises ``frame_length`` floats per
+        frame; blocks of ``_RMS_BLOCK_BYTES`` input keep that working set in L2.
+        """
+
+        total = audio.shape[-1]
+        pad = self.frame_length // 2
+        n_frames = 1 + (total + 2 * pad - self.frame_length) // self.hop_length
+        block = max(_RMS_BLOCK_BYTES // (self.hop_length * audio.itemsize), 1)
+
+        for first in range(0, n_frames, block):
+            last = min(first + block, n_frames)
+            # Sample span of frames [first, last) once the signal is centre-padded.
+            lo = first * self.hop_length - pad
+            hi = (last - 1) * self.hop_length + self.frame_length - pad
+            segment = audio[max(lo, 0) : min(hi, total)]
+            if lo < 0 or hi > total:
+                segment = np.pad(segment, (max(-lo, 0), max(hi - total, 0)))
+            yield librosa.feature.rms(
+                y=segment,
+                frame_length=self.frame_length,
+                hop_length=self.hop_length,
+                center=False,
+            )[0]
+
+    def window_bounds(
+        self, rms_db: np.ndarray, start: int, end: int
+    ) -> Optional[Tuple[int, int]]:
+        """Trim the sample window ``[start, end)`` using precomputed ``rms_db`` frames."""
+
+        first = int(librosa.samples_to_frames(start, hop_length=self.hop_length))
+        last = min(
+            int(librosa.samples_to_frames(end, hop_length=self.hop_length)) + 1,
+            rms_db.shape[-1],
+        )
+        frames = np.flatnonzero(rms_db[first:last] > self.threshold_db)
+        if frames.size == 0:
             return None
 
-        frames = np.flatnonzero(mask)
-        start = librosa.frames_to_samples(frames[0], hop_length=self.hop_length)
-        end = librosa.frames_to_samples(frames[-1], hop_length=self.hop_length) + self.frame_length
-        return max(start, 0), min(int(end), audio.shape[-1])
+        trim_start = librosa.frames_to_samples(first + frames[0], hop_length=self.hop_length)
+        trim_end = (
+            librosa.frames_to_samples(first + frames[-1], hop_length=self.hop_length)
+            + self.frame_length
+        )
+        return max(int(trim_start), start), min(int(trim_end), end)
+
+    def trim_bounds(self, audio: np.ndarray) -> Optional[Tuple[int, int]]:
+        rms_db = self.frame_db(audio)
+        if rms_db is None:
+            return None
+        return self.window_bounds(rms_db, 0, audio.shape[-1])
 
 
 def preprocess_audio_file(
@@ -67,10 +152,22 @@ def preprocess_audio_file(
     """Load ``audio_path`` and write a manifest that RunPod pods can consume."""
 
     cfg = config or PreprocessorConfig()
-    audio, _ = librosa.load(audio_path, sr=cfg.sample_rate, mono=True)
     detector = SilenceDetector(cfg.silence_threshold_db, cfg.frame_length, cfg.hop_length)
 
-    chunk_payloads = _chunk_audio(audio, cfg, detector)
+    binary_url: Optional[str] = None
+    with _open_audio(audio_path, cfg.sample_rate) as audio:
+        # Frame the whole signal once; every chunk window reuses these RMS values.
+        rms_db = detector.frame_db(audio)
+
+        if cfg.binary_sidecar:
+            sidecar_path = manifest_path.with_suffix(".pcm")
+            sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+            with sidecar_path.open("wb") as sidecar:
+                chunk_payloads = _chunk_audio(audio, rms_db, cfg, detector, sidecar=sidecar)
+            binary_url = sidecar_path.resolve().as_uri()
+        else:
+            chunk_payloads = _chunk_audio(audio, rms_db, cfg, detector)
+
     manifest = PreprocessManifest(
         sample_rate=cfg.sample_rate,
         source=str(audio_path.resolve()),
@@ -78,65 +175,117 @@ def preprocess_audio_file(
         overlap_seconds=cfg.overlap_seconds,
         created_at=datetime.utcnow().isoformat(),
         chunks=chunk_payloads,
+        binary_url=binary_url,
     )
 
     save_manifest(manifest, manifest_path)
     return manifest
 
 
+@contextmanager
+def _open_audio(audio_path: Path, sample_rate: int) -> Iterator[AudioSource]:
+    """Stream ``audio_path`` from disk when possible, else load it with librosa.
+
+    Files libsndfile decodes natively at ``sample_rate`` are read window by
+    window; anything needing resampling or another decoder is loaded whole.
+    """
+
+    try:
+        handle = sf.SoundFile(audio_path)
+    except RuntimeError:
+        handle = None
+
+    if handle is not None and handle.samplerate == sample_rate and handle.seekable():
+        with handle:
+            yield StreamedAudio(handle)
+        return
+
+    if handle is not None:
+        handle.close()
+    audio, _ = librosa.load(audio_path, sr=sample_rate, mono=True)
+    yield audio
+
+
 def _chunk_audio(
-    audio: np.ndarray,
+    audio: AudioSource,
+    rms_db: Optional[np.ndarray],
     cfg: PreprocessorConfig,
     detector: SilenceDetector,
+    sidecar: Optional[BinaryIO] = None,
 ) -> List[ChunkPayload]:
+    if rms_db is None:
+        return []
+
     chunk_size = int(cfg.chunk_seconds * cfg.sample_rate)
     overlap = int(cfg.overlap_seconds * cfg.sample_rate)
     min_len = int(cfg.min_chunk_seconds * cfg.sample_rate)
 
     cursor = 0
     total = len(audio)
-    chunks: List[ChunkPayload] = []
+    windows: List[Tuple[int, int]] = []
 
     while cursor < total:
         start = max(cursor - overlap, 0)
         end = min(cursor + chunk_size, total)
-        segment = audio[start:end]
+        cursor += chunk_size
 
-        trim = detector.trim_bounds(segment)
-        if trim is None:
-            cursor += chunk_size
+        bounds = detector.window_bounds(rms_db, start, end)
+        if bounds is None:
             continue
 
-        trim_start, trim_end = trim
-        trimmed = segment[trim_start:trim_end]
-        if trimmed.size < min_len:
-            cursor += chunk_size
+        absolute_start, absolute_end = bounds
+        if absolute_end - absolute_start < min_len:
             continue
+        windows.append(bounds)
+
+    # Encoding is independent per chunk and the numpy/base64 work releases the GIL.
+    with ThreadPoolExecutor(max_workers=cfg.max_workers or os.cpu_count()) as pool:
+        if sidecar is None:
+            make_payload = partial(_make_payload, audio, sample_rate=cfg.sample_rate)
+            return list(pool.map(make_payload, windows))
+
+        pcm_chunks = pool.map(lambda bounds: to_pcm16(audio[bounds[0] : bounds[1]]), windows)
+        return _write_sidecar(sidecar, windows, pcm_chunks, cfg.sample_rate)
 
-        chunk_id = uuid.uuid4().hex
-        absolute_start = start + trim_start
-        absolute_end = start + trim_end
 
-        wav_b64 = _encode_wav(trimmed, cfg.sample_rate)
+def _make_payload(audio: AudioSource, bounds: Tuple[int, int], sample_rate: int) -> ChunkPayload:
+    absolute_start, absolute_end = bounds
+    trimmed = audio[absolute_start:absolute_end]
+    return ChunkPayload(
+        chunk_id=uuid.uuid4().hex,
+        start=int(absolute_start),
+        end=int(absolute_end),
+        duration=float(trimmed.size / sample_rate),
+        audio_b64=encode_pcm16(trimmed),
+        encoding=PCM_S16LE,
+    )
+
+
+def _write_sidecar(
+    sidecar: BinaryIO,
+    windows: Iterable[Tuple[int, int]],
+    pcm_chunks: Iterable[np.ndarray],
+    sample_rate: int,
+) -> List[ChunkPayload]:
+    """Append each chunk's PCM to ``sidecar`` and reference it by byte range."""
+
+    chunks: List[ChunkPayload] = []
+    offset = 0
+    for (absolute_start, absolute_end), pcm in zip(windows, pcm_chunks):
+        sidecar.write(pcm.data)
         chunks.append(
             ChunkPayload(
-                chunk_id=chunk_id,
+                chunk_id=uuid.uuid4().hex,
                 start=int(absolute_start),
                 end=int(absolute_end),
-                duration=float(trimmed.size / cfg.sample_rate),
-                audio_b64=wav_b64,
+                duration=float(pcm.size / sample_rate),
+                byte_offset=offset,
+                byte_length=pcm.nbytes,
+                encoding=PCM_S16LE,
             )
         )
-
-        cursor += chunk_size
-
+        offset += pcm.nbytes
     return chunks
 
 
-def _encode_wav(audio: np.ndarray, sample_rate: int) -> str:
-    buffer = io.BytesIO()
-    sf.write(buffer, audio, sample_rate, format="WAV")
-    return base64.b64encode(buffer.getvalue()).decode("utf-8")
-
-
 __all__ = ["PreprocessorConfig", "preprocess_audio_file"]
@@ -1,9 +1,11 @@
 """Helpers for interacting with the Seed-VC RunPod worker."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
+
+import orjson
 
 from .manifests import ConvertedManifest, save_converted_manifest
 
@@ -14,10 +16,24 @@ def submit_to_runpod(
     api_key: Optional[str] = None,
     timeout: int = 600,
     output_path: Optional[Path] = None,
+    binary_url: Optional[str] = None,
 ) -> ConvertedManifest:
-    """Send ``manifest_path`` to the Seed-VC endpoint and return the response."""
+    """Send ``manifest_path`` to the Seed-VC endpoint and return the response.
+
+    ``binary_url`` overrides the manifest's sidecar location with one the worker
+    can reach, e.g. after uploading the ``.pcm`` file written by ``--binary-sidecar``.
+    """
 
-    payload = json.loads(manifest_path.read_text())
+    payload = orjson.loads(manifest_path.read_bytes())
+    if binary_url:
+        payload["binary_url"] = binary_url
+    sidecar_url = payload.get("binary_url")
+    if sidecar_url and urlparse(sidecar_url).scheme not in ("http", "https"):
+        # The preprocessor records a local file:// URI that the worker rejects.
+        raise ValueError(
+            f"Manifest binary_url {sidecar_url!r} is not reachable by the worker; "
+            "upload the sidecar and pass its http(s) URL via --binary-url."
+        )
     response_data = _post_json(endpoint, payload=payload, api_key=api_key, timeout=timeout)
     converted = ConvertedManifest.from_dict(response_data)
 
@@ -38,9 +54,11 @@ def _post_json(endpoint: str, payload: dict, api_key: Optional[str], timeout: in
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
 
-    response = requests.post(endpoint, json=payload, headers=headers, timeout=timeout)
+    response = requests.post(
+        endpoint, data=orjson.dumps(payload), headers=headers, timeout=timeout
+    )
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
 
 __all__ = ["submit_to_runpod"]
@@ -1,17 +1,27 @@
 """Step C of the pipeline: stitch converted chunks back into a WAV."""
 from __future__ import annotations
 
-import base64
-import io
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional
 
-import librosa
 import numpy as np
 import soundfile as sf
+import soxr
+from numba import njit
 
-from .manifests import ConvertedManifest, ChunkPayload, load_converted_manifest
+from .codec import decode_chunk_audio, decode_chunk_pcm16
+from .manifests import (
+    LEGACY_WAV,
+    PCM_S16LE,
+    ConvertedManifest,
+    ChunkPayload,
+    chunks_as_soa,
+    load_converted_manifest,
+)
+
+# Unity gain for the fixed-point crossfade weights.
+_Q15_ONE = 1 << 15
 
 
 @dataclass
@@ -28,52 +38,108 @@ def stitch_manifest_to_file(
 ) -> Path:
     cfg = config or StitchConfig()
     manifest_obj = manifest or load_converted_manifest(manifest_path)
-    audio = stitch_chunks(manifest_obj.converted_chunks, cfg)
+    audio = stitch_chunks(
+        manifest_obj.converted_chunks, cfg, source_sample_rate=manifest_obj.sample_rate
+    )
     output_path.parent.mkdir(parents=True, exist_ok=True)
     sf.write(output_path, audio, cfg.sample_rate)
     return output_path
 
 
-def stitch_chunks(chunks: Iterable[ChunkPayload], cfg: StitchConfig) -> np.ndarray:
-    ordered = sorted(chunks, key=lambda chunk: chunk.start)
+def stitch_chunks(
+    chunks: Iterable[ChunkPayload],
+    cfg: StitchConfig,
+    source_sample_rate: Optional[int] = None,
+) -> np.ndarray:
+    source_sr = source_sample_rate or cfg.sample_rate
+    starts, _, _, payloads = chunks_as_soa(chunks)
+    order = np.argsort(starts, kind="stable")
     crossfade = int(cfg.crossfade_seconds * cfg.sample_rate)
-
-    buffer = np.zeros(1, dtype=np.float32)
-    for item in ordered:
-        chunk_audio = _decode_chunk(item, cfg.sample_rate)
-        buffer = _place_chunk(buffer, chunk_audio, start=item.start, crossfade=crossfade)
+    fade = np.linspace(0.0, 1.0, num=crossfade, dtype=np.float32)
+
+    # Without resampling, pcm_s16le chunks are blended in Q15 fixed point on an
+    # int16 buffer (half the bytes touched) and converted to float only once.
+    pcm16 = source_sr == cfg.sample_rate and all(
+        payload.encoding == PCM_S16LE for payload in payloads
+    )
+    if pcm16:
+        decoded = [(int(starts[index]), decode_chunk_pcm16(payloads[index])) for index in order]
+        fade = _to_q15(fade)
+    else:
+        decoded = [
+            (int(starts[index]), _decode_chunk(payloads[index], source_sr, cfg.sample_rate))
+            for index in order
+        ]
+    total = max((start + audio.size for start, audio in decoded), default=0)
+
+    # Size the output once so placing a chunk never reallocates the buffer.
+    buffer = np.zeros(total, dtype=np.int16 if pcm16 else np.float32)
+    for start, chunk_audio in decoded:
+        _place_chunk(buffer, chunk_audio, start=start, fade=fade)
+
+    if pcm16:
+        audio = buffer.astype(np.float32)
+        audio /= 32768.0
+        return audio
     return buffer
 
 
-def _decode_chunk(chunk: ChunkPayload, target_sr: int) -> np.ndarray:
-    audio_bytes = base64.b64decode(chunk.audio_b64)
-    data, sr = sf.read(io.BytesIO(audio_bytes), dtype="float32")
-    if sr != target_sr:
-        data = librosa.resample(data, orig_sr=sr, target_sr=target_sr)
-    return np.asarray(data, dtype=np.float32)
+def _decode_chunk(chunk: ChunkPayload, source_sr: int, target_sr: int) -> np.ndarray:
+    if chunk.encoding == LEGACY_WAV:
+        # Legacy WAV chunks carry their own rate; resample straight to the target.
+        return decode_chunk_audio(chunk, sample_rate=target_sr)
+    data = decode_chunk_audio(chunk)
+    if source_sr != target_sr:
+        data = soxr.resample(data, source_sr, target_sr, quality="HQ")
+    if data.dtype != np.float32:
+        data = data.astype(np.float32, copy=False)
+    return data
 
 
-def _place_chunk(existing: np.ndarray, chunk: np.ndarray, start: int, crossfade: int) -> np.ndarray:
+def _place_chunk(existing: np.ndarray, chunk: np.ndarray, start: int, fade: np.ndarray) -> None:
+    """Blend ``chunk`` into the pre-sized ``existing`` buffer in place.
+
+    ``fade`` is the precomputed crossfade ramp shared by every chunk: float32 for
+    float buffers, Q15 weights (see :func:`_to_q15`) for int16 buffers.
+    """
+
     if chunk.size == 0:
-        return existing
+        return
 
     end = start + chunk.size
-    if end > existing.size:
-        pad = end - existing.size
-        existing = np.pad(existing, (0, pad))
-
-    overlap = min(crossfade, chunk.size, existing.size - start)
+    overlap = min(fade.size, chunk.size)
     if overlap > 0:
-        fade = np.linspace(0.0, 1.0, num=overlap, dtype=np.float32)
-        keep = 1.0 - fade
-        existing[start : start + overlap] = (
-            existing[start : start + overlap] * keep + chunk[:overlap] * fade
-        )
+        if overlap < fade.size:
+            # Chunks shorter than the crossfade still ramp fully over their length.
+            fade = np.linspace(0.0, 1.0, num=overlap, dtype=np.float32)
+            if existing.dtype == np.int16:
+                fade = _to_q15(fade)
+        if existing.dtype == np.int16:
+            _blend_q15(existing, chunk, start, overlap, fade)
+        else:
+            _blend(existing, chunk, start, overlap, fade)
         existing[start + overlap : end] = chunk[overlap:]
     else:
         existing[start:end] = chunk
 
-    return existing
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _blend(existing, chunk, start, overlap, fade):  # pragma: no cover - compiled by numba
+    # One fused read-modify-write pass over the overlap instead of numpy temporaries.
+    for i in range(overlap):
+        existing[start + i] = existing[start + i] * (1.0 - fade[i]) + chunk[i] * fade[i]
+
+
+def _to_q15(fade: np.ndarray) -> np.ndarray:
+    return np.round(fade * _Q15_ONE).astype(np.int32)
+
+
+@njit(cache=True, boundscheck=False)
+def _blend_q15(existing, chunk, start, overlap, fade):  # pragma: no cover - compiled by numba
+    # int16 samples, Q15 weights summing to exactly 1 << 15, int32-range accumulator.
+    for i in range(overlap):
+        mixed = np.int32(existing[start + i]) * (_Q15_ONE - fade[i]) + np.int32(chunk[i]) * fade[i]
+        existing[start + i] = (mixed + (_Q15_ONE >> 1)) >> 15
 
 
 __all__ = ["StitchConfig", "stitch_manifest_to_file", "stitch_chunks"]
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from singing_voice.codec import decode_chunk_audio, decode_chunk_pcm16, open_sidecar
+from singing_voice.manifests import PCM_S16LE, ChunkPayload, load_manifest
+from singing_voice.preprocess import PreprocessorConfig, preprocess_audio_file
+
+SR = 16_000
+
+
+@pytest.fixture
+def source_wav(tmp_path):
+    rng = np.random.default_rng(7)
+    t = np.arange(SR * 30) / SR
+    gate = np.sin(2 * np.pi * 0.1 * t) > -0.5  # Silent gaps between chunks.
+    audio = (0.3 * np.sin(2 * np.pi * 220 * t) * gate).astype(np.float32)
+    audio += (0.01 * rng.standard_normal(audio.size) * gate).astype(np.float32)
+    path = tmp_path / "in.wav"
+    sf.write(path, audio, SR)
+    return path
+
+
+def test_sidecar_round_trip_matches_inline(source_wav, tmp_path):
+    cfg = PreprocessorConfig(sample_rate=SR, chunk_seconds=8.0)
+    preprocess_audio_file(source_wav, tmp_path / "inline" / "manifest.json", cfg)
+    cfg.binary_sidecar = True
+    preprocess_audio_file(source_wav, tmp_path / "binary" / "manifest.json", cfg)
+
+    inline = load_manifest(tmp_path / "inline" / "manifest.json")
+    binary = load_manifest(tmp_path / "binary" / "manifest.json")
+    sidecar_path = tmp_path / "binary" / "manifest.pcm"
+    assert binary.binary_url == sidecar_path.resolve().as_uri()
+    sidecar = open_sidecar(sidecar_path)
+
+    assert len(binary.chunks) == len(inline.chunks) > 1
+    for with_range, with_b64 in zip(binary.chunks, inline.chunks):
+        assert (with_range.start, with_range.end) == (with_b64.start, with_b64.end)
+        assert with_range.audio_b64 is None and with_range.byte_length > 0
+        np.testing.assert_array_equal(
+            decode_chunk_pcm16(with_range, sidecar), decode_chunk_pcm16(with_b64)
+        )
+        np.testing.assert_array_equal(
+            decode_chunk_audio(with_range, sidecar), decode_chunk_audio(with_b64)
+        )
+
+
+def _ranged(offset: int, length: int) -> ChunkPayload:
+    return ChunkPayload(
+        chunk_id="c", start=0, end=1, encoding=PCM_S16LE, byte_offset=offset, byte_length=length
+    )
+
+
+@pytest.fixture
+def ten_sample_sidecar(tmp_path):
+    path = tmp_path / "audio.pcm"
+    path.write_bytes(np.arange(10, dtype="<i2").tobytes())
+    return open_sidecar(path)
+
+
+def test_valid_sidecar_range(ten_sample_sidecar):
+    np.testing.assert_array_equal(decode_chunk_pcm16(_ranged(4, 6), ten_sample_sidecar), [2, 3, 4])
+    assert decode_chunk_pcm16(_ranged(20, 0), ten_sample_sidecar).size == 0
+
+
+@pytest.mark.parametrize(
+    "offset,length",
+    [(-4, 4), (0, -2), (3, 4), (4, 3), (16, 6), (20, 2), (0, 22)],
+)
+def test_bad_sidecar_ranges_are_rejected(ten_sample_sidecar, offset, length):
+    with pytest.raises(ValueError, match="sidecar range"):
+        decode_chunk_pcm16(_ranged(offset, length), ten_sample_sidecar)
+
+
+def test_ranged_chunk_without_sidecar_is_rejected():
+    with pytest.raises(ValueError, match="none was provided"):
+        decode_chunk_pcm16(_ranged(0, 2))
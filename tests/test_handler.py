@@ -0,0 +1,109 @@
+import functools
+import http.server
+import os
+import threading
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+pytest.importorskip("requests")
+
+from runpod_worker import handler  # noqa: E402
+from runpod_worker.seedvc_worker import _load_target  # noqa: E402
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def served(tmp_path, monkeypatch):
+    """Serve ``tmp_path / "srv"`` over HTTP and point the asset cache at ``tmp_path / "cache"``."""
+
+    root = tmp_path / "srv"
+    root.mkdir()
+    monkeypatch.setenv(handler.ASSET_CACHE_ENV, str(tmp_path / "cache"))
+    monkeypatch.delenv(handler.ASSET_CACHE_MAX_BYTES_ENV, raising=False)
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(_QuietHandler, directory=str(root))
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield root, f"http://127.0.0.1:{server.server_port}", tmp_path / "cache"
+    server.shutdown()
+    server.server_close()
+
+
+def _resolve(url, name, tmp_path, pins=None):
+    """Resolve like one request would; without ``pins`` the request ends immediately."""
+
+    if pins is not None:
+        return handler._cached_download(url, name, tmp_path, pins)
+    pins = handler._Pins()
+    try:
+        return handler._cached_download(url, name, tmp_path, pins)
+    finally:
+        pins.release()
+
+
+def test_repeat_resolve_hits_cache_and_target_lru(served, tmp_path):
+    root, base, cache = served
+    sf.write(root / "voice.wav", np.zeros(1_600, dtype=np.float32), 16_000)
+    _load_target.cache_clear()
+
+    paths = []
+    for signature in ("a", "b", "c"):
+        path = _resolve(f"{base}/voice.wav?X-Amz-Signature={signature}", "target.wav", tmp_path)
+        _load_target(str(path), path.stat().st_mtime, 16_000)
+        paths.append(path)
+
+    assert paths[0] == paths[1] == paths[2]
+    assert list(cache.iterdir()) == [paths[0]]
+    info = _load_target.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_assets_sharing_a_path_keep_separate_entries(served, tmp_path):
+    root, base, cache = served
+    (root / "get").write_bytes(b"x" * 100)
+
+    pins = handler._Pins()
+    voice = _resolve(f"{base}/get?id=voice", handler.DEFAULT_TARGET_NAME, tmp_path, pins)
+    model = _resolve(f"{base}/get?id=model", handler.DEFAULT_TARGET_NAME, tmp_path, pins)
+    other = _resolve(f"{base}/get?id=voice", handler.DEFAULT_MODEL_NAME, tmp_path, pins)
+
+    assert len({voice, model, other}) == 3
+    assert all(path.exists() for path in (voice, model, other))
+
+
+def test_changed_content_replaces_old_version(served, tmp_path):
+    root, base, cache = served
+    asset = root / "model.pt"
+    asset.write_bytes(b"a" * 100)
+    first = _resolve(f"{base}/model.pt", "model.pt", tmp_path)
+
+    asset.write_bytes(b"b" * 100)
+    stat = asset.stat()
+    os.utime(asset, (stat.st_atime, stat.st_mtime + 60))  # New Last-Modified, same size.
+    second = _resolve(f"{base}/model.pt", "model.pt", tmp_path)
+
+    assert second != first and second.read_bytes() == b"b" * 100
+    assert list(cache.iterdir()) == [second]
+
+
+def test_prune_evicts_lru_but_never_pinned_paths(served, tmp_path, monkeypatch):
+    root, base, cache = served
+    for name in ("a", "b", "c"):
+        (root / name).write_bytes(name.encode() * 100)
+    monkeypatch.setenv(handler.ASSET_CACHE_MAX_BYTES_ENV, "150")
+
+    pins = handler._Pins()
+    first = _resolve(f"{base}/a", "a.bin", tmp_path, pins)
+    second = _resolve(f"{base}/b", "b.bin", tmp_path, pins)
+    assert first.exists() and second.exists()  # Over the cap, but both are in use.
+
+    pins.release()
+    third = _resolve(f"{base}/c", "c.bin", tmp_path)
+    assert not first.exists() and not second.exists() and third.exists()
@@ -0,0 +1,52 @@
+import librosa
+import numpy as np
+import pytest
+
+from singing_voice import preprocess
+from singing_voice.preprocess import SilenceDetector
+
+FRAMINGS = [(1024, 256), (2048, 512), (1025, 300), (512, 512)]
+
+
+@pytest.fixture
+def rng() -> np.random.Generator:
+    return np.random.default_rng(1234)
+
+
+@pytest.mark.parametrize("frame_length,hop_length", FRAMINGS)
+@pytest.mark.parametrize("length", [1, 7, 511, 1024, 1025, 4097, 100_003])
+@pytest.mark.parametrize("block_bytes", [4096, 1 << 20])
+def test_rms_blocks_match_librosa_centered(
+    monkeypatch, rng, frame_length, hop_length, length, block_bytes
+):
+    # Small blocks force frames to straddle block edges and the padded borders.
+    monkeypatch.setattr(preprocess, "_RMS_BLOCK_BYTES", block_bytes)
+    audio = rng.uniform(-1.0, 1.0, length).astype(np.float32)
+    detector = SilenceDetector(-40.0, frame_length, hop_length)
+
+    blocked = np.concatenate(list(detector._rms_blocks(audio)))
+    expected = librosa.feature.rms(
+        y=audio, frame_length=frame_length, hop_length=hop_length, center=True
+    )[0]
+
+    assert blocked.shape == expected.shape
+    np.testing.assert_allclose(blocked, expected, rtol=1e-5, atol=1e-7)
+
+
+def test_window_bounds_use_global_max_reference():
+    sr = 16_000
+    t = np.arange(sr) / sr
+    tone = np.sin(2 * np.pi * 220 * t).astype(np.float32)
+    # One loud second followed by one second ~54 dB below it.
+    audio = np.concatenate([0.5 * tone, 0.001 * tone])
+    detector = SilenceDetector(-40.0, 1024, 256)
+    rms_db = detector.frame_db(audio)
+
+    # Relative to its own peak the quiet half is loud, but not to the whole file.
+    quiet_start = sr + detector.frame_length
+    assert detector.window_bounds(rms_db, quiet_start, 2 * sr) is None
+    assert detector.trim_bounds(audio[sr:]) is not None
+
+    start, end = detector.window_bounds(rms_db, sr // 2, 2 * sr)
+    assert start == sr // 2
+    assert sr <= end < sr + 2 * detector.frame_length
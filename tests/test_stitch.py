@@ -0,0 +1,98 @@
+import io
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from singing_voice.codec import b64encode_as_string, to_pcm16
+from singing_voice.manifests import LEGACY_WAV, PCM_S16LE, ChunkPayload
+from singing_voice.stitch import StitchConfig, _place_chunk, _to_q15, stitch_chunks
+
+SR = 16_000
+
+
+@pytest.fixture
+def pcm_chunks() -> list:
+    """Overlapping int16 chunks of random noise, some shorter than the crossfade."""
+
+    rng = np.random.default_rng(20240611)
+    chunks, start = [], 0
+    for length in (6_000, 300, 9_000, 1_000, 7_500):
+        chunks.append((start, to_pcm16(rng.uniform(-0.9, 0.9, length).astype(np.float32))))
+        start += max(length - int(rng.integers(100, 2_000)), 1)
+    return chunks
+
+
+def _ramp(crossfade: int, dtype) -> np.ndarray:
+    fade = np.linspace(0.0, 1.0, num=crossfade, dtype=np.float32)
+    return _to_q15(fade) if dtype == np.int16 else fade
+
+
+def _place_all(chunks, crossfade: int, dtype) -> np.ndarray:
+    total = max(start + samples.size for start, samples in chunks)
+    buffer = np.zeros(total, dtype=dtype)
+    fade = _ramp(crossfade, dtype)
+    for start, samples in chunks:
+        audio = samples if dtype == np.int16 else samples.astype(np.float32) / 32768.0
+        _place_chunk(buffer, audio, start=start, fade=fade)
+    return buffer if dtype == np.int16 else buffer * 32768.0
+
+
+def _payload(start: int, samples: np.ndarray, encoding: str) -> ChunkPayload:
+    if encoding == LEGACY_WAV:
+        handle = io.BytesIO()
+        sf.write(handle, samples, SR, format="WAV", subtype="PCM_16")
+        data = handle.getbuffer()
+    else:
+        data = samples.data
+    return ChunkPayload(
+        chunk_id=f"c{start}",
+        start=start,
+        end=start + samples.size,
+        audio_b64=b64encode_as_string(data),
+        encoding=encoding,
+    )
+
+
+@pytest.mark.parametrize("crossfade", [0, 1, 37, 800, 2_400])
+def test_q15_blend_matches_float_blend(pcm_chunks, crossfade):
+    fixed = _place_all(pcm_chunks, crossfade, np.int16).astype(np.float64)
+    floating = _place_all(pcm_chunks, crossfade, np.float32).astype(np.float64)
+
+    assert np.max(np.abs(fixed - floating)) <= 2.0
+
+
+def test_stitch_chunks_pcm16_path_matches_float_path(pcm_chunks):
+    cfg = StitchConfig(sample_rate=SR, crossfade_seconds=0.05)
+    # Same samples wrapped as legacy WAV chunks take the float32 path.
+    fixed = stitch_chunks([_payload(s, a, PCM_S16LE) for s, a in pcm_chunks], cfg)
+    floating = stitch_chunks([_payload(s, a, LEGACY_WAV) for s, a in pcm_chunks], cfg)
+
+    assert fixed.dtype == floating.dtype == np.float32
+    assert fixed.shape == floating.shape
+    assert np.max(np.abs(fixed - floating)) * 32768 <= 2.0
+
+
+@pytest.mark.parametrize("dtype", [np.int16, np.float32])
+def test_short_chunk_ramps_over_its_own_length(dtype):
+    existing = np.full(1_000, 8_000 if dtype == np.int16 else 0.25, dtype=dtype)
+    chunk = np.full(100, -4_000 if dtype == np.int16 else -0.125, dtype=dtype)
+    _place_chunk(existing, chunk, start=500, fade=_ramp(400, dtype))
+
+    weights = np.linspace(0.0, 1.0, num=chunk.size)
+    expected = existing[0] * (1.0 - weights) + chunk[0] * weights
+    tolerance = 1.0 if dtype == np.int16 else 1e-6
+    np.testing.assert_allclose(existing[500:600], expected, atol=tolerance)
+    assert existing[599] == chunk[-1]
+    assert np.all(existing[:500] == existing[0]) and np.all(existing[600:] == existing[0])
+
+
+@pytest.mark.parametrize("encoding", [PCM_S16LE, LEGACY_WAV])
+def test_zero_crossfade_overwrites(pcm_chunks, encoding):
+    cfg = StitchConfig(sample_rate=SR, crossfade_seconds=0.0)
+    stitched = stitch_chunks([_payload(s, a, encoding) for s, a in pcm_chunks], cfg)
+
+    expected = np.zeros(stitched.size, dtype=np.float32)
+    for start, samples in pcm_chunks:
+        expected[start : start + samples.size] = samples / 32768.0
+    np.testing.assert_array_equal(stitched, expected)